@@ -1,5 +1,8 @@
-import random
-from typing import List
+import numpy as np
+from typing import List, Optional, Union
+from .base_agent import BaseAgent
+from .population import PsychologicalPopulation
+from .rational_agent import RationalAgent
 
 class AgentFactory:
     """Factory for creating agents with different psychological profiles"""
@@ -7,22 +10,29 @@ class AgentFactory:
     @staticmethod
     def create_psychological_population(size: int, 
                                       trust_range: tuple = (0.3, 0.9),
-                                      loss_sensitivity_range: tuple = (1.0, 2.5)) -> List[PsychologicalAgent]:
-        """Create a population of psychological agents with varied psychology"""
+                                      loss_sensitivity_range: tuple = (1.0, 2.5),
+                                      seed: Optional[Union[int, np.random.Generator]] = None,
+                                      neighbors: Optional[List[List[int]]] = None,
+                                      history_length: int = 32) -> PsychologicalPopulation:
+        """Create a population of psychological agents with varied psychology
         
-        agents = []
-        for i in range(size):
-            trust = random.uniform(*trust_range)
-            loss_sens = random.uniform(*loss_sensitivity_range)
-            
-            agent = PsychologicalAgent(
-                agent_id=f"psych_agent_{i}",
-                trust_level=trust,
-                loss_sensitivity=loss_sens
-            )
-            agents.append(agent)
+        Passing a seed (or Generator) makes the drawn psychology reproducible. When
+        the network topology is known, `neighbors[i]` lists the indices agent i
+        connects to and those connections are allocated up front at default trust.
+        Each agent remembers its last `history_length` messages (0 for none).
+        """
         
-        return agents
+        # One batched draw per parameter instead of per-agent calls. This is a few
+        # milliseconds even for millions of agents (building the ID strings dominates),
+        # so generation is not split across processes.
+        rng = np.random.default_rng(seed)
+        trust = rng.uniform(trust_range[0], trust_range[1], size=size).astype(np.float32)
+        loss_sens = rng.uniform(loss_sensitivity_range[0], loss_sensitivity_range[1], size=size).astype(np.float32)
+        
+        agent_ids = [f"psych_agent_{i}" for i in range(size)]
+        
+        return PsychologicalPopulation.from_parameters(agent_ids, trust, loss_sens, neighbors=neighbors, rng=rng,
+                                                       history_length=history_length)
     
     @staticmethod
     def create_rational_population(size: int) -> List[RationalAgent]:
@@ -36,17 +46,22 @@ class AgentFactory:
         return agents
     
     @staticmethod
-    def create_mixed_population(size: int, psychological_ratio: float = 0.5) -> List[BaseAgent]:
+    def create_mixed_population(size: int, psychological_ratio: float = 0.5,
+                                seed: Optional[Union[int, np.random.Generator]] = None) -> List[BaseAgent]:
         """Create a mixed population of psychological and rational agents"""
         
         psych_count = int(size * psychological_ratio)
-        rational_count = size - psych_count
         
-        agents = []
-        agents.extend(AgentFactory.create_psychological_population(psych_count))
-        agents.extend(AgentFactory.create_rational_population(rational_count))
+        rng = np.random.default_rng(seed)
+        population = AgentFactory.create_psychological_population(psych_count, seed=rng)
         
-        # Shuffle to mix them up
-        random.shuffle(agents)
+        # One permutation mixes them up: slots drawing a value below psych_count hold
+        # that psychological agent, the rest hold a rational agent
+        agents: List[BaseAgent] = [None] * size
+        for slot, order in enumerate(rng.permutation(size).tolist()):
+            if order < psych_count:
+                agents[slot] = population[order]
+            else:
+                agents[slot] = RationalAgent(agent_id=f"rational_agent_{order - psych_count}")
         
         return agents
\ No newline at end of file
@@ -1,7 +1,31 @@
+import numpy as np
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict
 from dataclasses import dataclass, field
 
+# Simple learning rate shared by every agent's belief update
+LEARNING_RATE = 0.3
+
+# Topic -> small integer ID, shared by every population so topic IDs double as belief-matrix columns
+TOPIC_REGISTRY: Dict[str, int] = {}
+
+def intern_topic(topic: str) -> int:
+    """Integer ID for `topic`, assigning the next free one if the topic is new"""
+    topic_id = TOPIC_REGISTRY.get(topic)
+    if topic_id is None:
+        topic_id = TOPIC_REGISTRY[topic] = len(TOPIC_REGISTRY)
+    return topic_id
+
+# Information as a 20-byte record, so whole cascade waves travel as one contiguous array.
+# source_id is the source's node index in the receiving population's trust matrix.
+info_dtype = np.dtype([
+    ('topic_id', np.int32),
+    ('value', np.float32),
+    ('confidence', np.float32),
+    ('source_id', np.int32),
+    ('timestamp', np.int32)
+])
+
 # Base class for agents in the simulation
 @dataclass
 class Information:
@@ -11,15 +35,30 @@ class Information:
     confidence: float  # 0.0 to 1.0 (how certain the information is)
     source_id: str  # ID of the agent who originated the information
     timestamp: int = 0  # Time when the information was created
+    topic_id: int = field(init=False, repr=False)  # Interned topic, see TOPIC_REGISTRY
+
+    def __post_init__(self):
+        self.topic_id = intern_topic(self.topic)
+
+    def to_array(self, source_index: int) -> np.ndarray:
+        """This information as a 1-element info_dtype array
+        
+        `source_index` is the source's node index in the receiving population
+        (see PsychologicalPopulation.node_index); there is no default, since a
+        made-up index would credit the message to whichever node holds it.
+        """
+        return np.array([(self.topic_id, self.value, self.confidence, source_index, self.timestamp)],
+                        dtype=info_dtype)
 
 class BaseAgent(ABC):
     """Base class for all agents in the simulation network"""
 
+    __slots__ = ('agent_id',)
+
     def __init__(self, agent_id: str):
+        # Beliefs, trust and history storage is left to subclasses, which can keep
+        # it in shared population arrays instead of per-agent dicts
         self.agent_id = agent_id
-        self.beliefs: Dict[str, float] = {} # topic -> confidence in the belief
-        self.connections: Dict[str, float] = {} # agent_id -> trust level (0.0 to 1.0)
-        self.information_history: List[Information] = []
 
     @abstractmethod
     def process_information(self, info: Information, source_trust: float) -> float:
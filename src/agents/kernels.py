@@ -0,0 +1,162 @@
+import numpy as np
+from .base_agent import LEARNING_RATE
+
+# Numba is optional: without it the batched updates use the Cython build or plain NumPy
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Without Numba, a compiled build of _kernels.pyx is the next choice when present
+try:
+    from ._kernels import update_beliefs as _cython_update_beliefs
+    CYTHON_AVAILABLE = True
+except ImportError:
+    CYTHON_AVAILABLE = False
+
+# CuPy is optional: populations moved to the GPU run the array-op kernel on CuPy arrays
+try:
+    import cupy
+    import cupyx
+    CUPY_AVAILABLE = True
+except ImportError:
+    cupy = None
+    CUPY_AVAILABLE = False
+
+# Beliefs (-1.0 to 1.0) are stored as int8 and trust levels (0.0 to 1.0) as uint8;
+# both are decoded to float32 only for the arithmetic
+BELIEF_SCALE = 127
+TRUST_SCALE = 255
+
+def get_array_module(array):
+    """NumPy or CuPy, whichever `array` belongs to"""
+    if CUPY_AVAILABLE:
+        return cupy.get_array_module(array)
+    return np
+
+def asnumpy(array):
+    """Host copy of `array` if it lives on the GPU, otherwise `array` itself"""
+    if CUPY_AVAILABLE and isinstance(array, cupy.ndarray):
+        return cupy.asnumpy(array)
+    return array
+
+def scatter_add(target, indices, values):
+    """target[indices] += values, accumulating repeated indices"""
+    if CUPY_AVAILABLE and isinstance(target, cupy.ndarray):
+        cupyx.scatter_add(target, indices, values)
+    else:
+        np.add.at(target, indices, values)
+
+def encode_beliefs(beliefs):
+    """Quantize beliefs in [-1, 1] to int8"""
+    xp = get_array_module(beliefs)
+    return xp.rint(xp.clip(beliefs, -1.0, 1.0) * BELIEF_SCALE).astype(xp.int8)
+
+def decode_beliefs(quantized):
+    """Expand int8 beliefs back to float32 in [-1, 1]"""
+    xp = get_array_module(quantized)
+    return xp.asarray(quantized, dtype=xp.float32) / xp.float32(BELIEF_SCALE)
+
+def encode_trust(trust):
+    """Quantize trust levels in [0, 1] to uint8"""
+    xp = get_array_module(trust)
+    return xp.rint(xp.clip(trust, 0.0, 1.0) * TRUST_SCALE).astype(xp.uint8)
+
+def decode_trust(quantized):
+    """Expand uint8 trust levels back to float32 in [0, 1]"""
+    xp = get_array_module(quantized)
+    return xp.asarray(quantized, dtype=xp.float32) / xp.float32(TRUST_SCALE)
+
+def _update_beliefs_numpy(beliefs: np.ndarray, topic, receivers: np.ndarray,
+                          loss_sensitivity: np.ndarray, confirmation_bias: np.ndarray,
+                          info_value, source_trust: np.ndarray, out_delta: np.ndarray):
+    """Array-op belief update; runs on NumPy or CuPy arrays
+    
+    `topic` and `info_value` are either scalars shared by every receiver or
+    per-receiver arrays.
+    """
+
+    xp = get_array_module(beliefs)
+
+    # Step 1: Apply loss aversion - negative information feels worse. A wave-wide scalar value is
+    # branched on in Python, since CuPy's where() only takes an array condition
+    if np.isscalar(info_value):
+        psychological_impact = info_value * loss_sensitivity[receivers] if info_value < 0 else info_value
+    else:
+        psychological_impact = xp.where(info_value < 0, info_value * loss_sensitivity[receivers], info_value)
+
+    # Step 2: Weight by source trust
+    trusted_impact = psychological_impact * source_trust
+
+    # Step 3: Apply confirmation bias. The information's sign is fixed for the whole wave, so
+    # agreement is one multiply (-1, 0 or +1); the -0.5 offset makes a zero belief disconfirming
+    quantized = beliefs[receivers, topic]
+    current_belief = decode_beliefs(quantized)
+    agreement = xp.sign(quantized) * xp.sign(xp.asarray(info_value, dtype=xp.float32))
+    confirmation_bonus = xp.copysign(confirmation_bias[receivers], agreement - 0.5)
+
+    # Step 4: Update belief
+    new_belief = encode_beliefs(current_belief + LEARNING_RATE * (trusted_impact + confirmation_bonus))
+
+    beliefs[receivers, topic] = new_belief
+    out_delta[:] = xp.abs(decode_beliefs(new_belief) - current_belief)
+
+if NUMBA_AVAILABLE:
+    # Not cache=True: the package imports as both `agents` and `src.agents`, and a cache written
+    # under one name fails to load under the other. Not fastmath: FMA contraction would change rounding.
+    @njit(parallel=True)
+    def _kernel_update_beliefs(beliefs, topic, receivers, loss_sensitivity, confirmation_bias,
+                               info_value, source_trust, out_delta):
+        """Fused belief update: one pass over the receivers, no temporaries
+
+        Receivers must be unique, since each writes its own belief in parallel. Everything
+        is float32, as in the NumPy and Cython kernels, so all three store the same beliefs.
+        """
+        info_value = np.float32(info_value)
+        info_sign = np.sign(info_value)
+        scale = np.float32(BELIEF_SCALE)
+        learning_rate = np.float32(LEARNING_RATE)
+        for k in prange(receivers.shape[0]):
+            i = receivers[k]
+            current_belief = np.float32(beliefs[i, topic]) / scale
+
+            if info_value < 0:
+                psychological_impact = info_value * loss_sensitivity[i]
+            else:
+                psychological_impact = info_value
+
+            # Only strictly same-signed beliefs confirm; the -0.5 offset makes zero disconfirming
+            agreement = np.float32(np.sign(beliefs[i, topic])) * info_sign
+            confirmation_bonus = np.copysign(confirmation_bias[i], agreement - np.float32(0.5))
+
+            new_belief = current_belief + learning_rate * (psychological_impact * source_trust[k] + confirmation_bonus)
+            new_belief = min(max(new_belief, np.float32(-1.0)), np.float32(1.0))
+            quantized = np.rint(new_belief * scale)
+
+            beliefs[i, topic] = quantized
+            out_delta[k] = abs(quantized / scale - current_belief)
+
+if NUMBA_AVAILABLE:
+    _host_update_beliefs = _kernel_update_beliefs
+elif CYTHON_AVAILABLE:
+    _host_update_beliefs = _cython_update_beliefs
+else:
+    _host_update_beliefs = _update_beliefs_numpy
+
+def update_beliefs(beliefs, topic, receivers, loss_sensitivity, confirmation_bias,
+                   info_value, source_trust, out_delta):
+    """Belief update for one topic column, using the best kernel for where the arrays live"""
+    if get_array_module(beliefs) is np:
+        _host_update_beliefs(beliefs, topic, receivers, loss_sensitivity, confirmation_bias,
+                             info_value, source_trust, out_delta)
+    else:
+        # Purely elementwise, so the array-op formulation runs unchanged as GPU kernels
+        _update_beliefs_numpy(beliefs, topic, receivers, loss_sensitivity, confirmation_bias,
+                              info_value, source_trust, out_delta)
+
+def update_beliefs_per_message(beliefs, topics, receivers, loss_sensitivity, confirmation_bias,
+                               values, source_trust, out_delta):
+    """Belief update where receivers[k] processes its own message (topics[k], values[k])"""
+    _update_beliefs_numpy(beliefs, topics, receivers, loss_sensitivity, confirmation_bias,
+                          values, source_trust, out_delta)
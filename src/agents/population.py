@@ -0,0 +1,589 @@
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from .base_agent import TOPIC_REGISTRY, Information, info_dtype
+from .kernels import (CUPY_AVAILABLE, asnumpy, cupy, decode_beliefs, decode_trust, encode_trust,
+                      get_array_module, scatter_add, update_beliefs, update_beliefs_per_message)
+
+# Numeric arrays mirrored onto the GPU by PsychologicalPopulation.to_device
+_DEVICE_FIELDS = (
+    'base_trust_level', 'urgency_table', 'confirmation_bias', 'social_proof_weight',
+    'emotional_state', 'default_trust', 'beliefs', 'trust_indptr', 'trust_indices', 'trust_data',
+    'trust_sum', 'belief_abs_sum', 'belief_count'
+)
+
+def _from_float32(value: np.float32) -> float:
+    """Shortest decimal that round-trips through `value`'s float32, so a stored 0.9 reads back as 0.9"""
+    return float(np.format_float_positional(value, unique=True))
+
+def _repeat_rank(keys: np.ndarray) -> np.ndarray:
+    """How many times each key already appeared earlier in `keys` (0 for its first occurrence)"""
+    order = np.argsort(keys, kind='stable')
+    grouped = keys[order]
+    run_starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+    rank = np.empty(len(keys), dtype=np.int64)
+    rank[order] = np.arange(len(keys)) - np.repeat(run_starts, np.diff(np.r_[run_starts, len(keys)]))
+    return rank
+
+def _rounds(rank: np.ndarray, xp) -> list:
+    """Index batches that apply repeated keys in order, each batch holding every key at most once"""
+    if not rank.any():
+        return [slice(None)]
+    return [xp.asarray(np.flatnonzero(rank == r)) for r in range(int(rank.max()) + 1)]
+
+def _per_agent(value, size: int) -> np.ndarray:
+    """Broadcast a scalar or per-agent sequence into a float32 array of length `size`"""
+    return np.array(np.broadcast_to(np.asarray(value, dtype=np.float32), (size,)))
+
+@dataclass
+class PsychologicalPopulation:
+    """Struct-of-arrays storage for a population of psychological agents"""
+
+    agent_ids: List[str]
+
+    # Per-agent psychological parameters, one contiguous float32 array each
+    base_trust_level: np.ndarray  # 0.0 to 1.0
+    loss_sensitivity: np.ndarray  # 1.0 to 3.0
+    confirmation_bias: np.ndarray
+    social_proof_weight: np.ndarray
+    emotional_state: np.ndarray  # -1.0 (stressed) to 1.0 (confident)
+    default_trust: np.ndarray
+
+    # Share-time urgency by sign of the information: row 0 for good news (1.0), row 1 for
+    # bad news (loss sensitivity). loss_sensitivity is a view of row 1, so they never diverge.
+    urgency_table: np.ndarray
+
+    # beliefs[agent, topic_id] -> belief (-1.0 to 1.0) quantized to int8, columns are TOPIC_REGISTRY IDs
+    beliefs: np.ndarray
+
+    # Trust matrix in CSR form: row i holds agent i's trust (0.0 to 1.0, quantized to uint8) in each connected node.
+    # Columns are node indices; the population's own agents come first, other sources after.
+    trust_indptr: np.ndarray
+    trust_indices: np.ndarray
+    trust_data: np.ndarray
+    # Connections added since the CSR arrays were last rebuilt, (row, node) -> quantized trust.
+    # set_trust buffers new connections here so each costs O(1); flush_trust merges them in bulk.
+    pending_trust: Dict[Tuple[int, int], int]
+    # Running per-agent totals kept in quantized units, so summaries are O(1) and never drift:
+    # trust_sum in 1/255 steps over the agent's connections, belief_abs_sum in 1/127 steps
+    # over its beliefs, belief_count the number of non-zero beliefs
+    trust_sum: np.ndarray
+    belief_abs_sum: np.ndarray
+    belief_count: np.ndarray
+
+    # Agent IDs are interned once here, so trust values never need a string-keyed dict of boxed floats
+    node_ids: List[str]
+    node_to_idx: Dict[str, int]
+
+    # history[agent, slot] ring buffer of the most recent info_dtype messages; history_count[agent] is the
+    # total received, so the next write goes to slot history_count % history length
+    history: np.ndarray
+    history_count: np.ndarray
+
+    # Random source for the population's stochastic decisions
+    rng: np.random.Generator = field(default_factory=np.random.default_rng)
+
+    @classmethod
+    def from_parameters(cls, agent_ids: List[str], trust_level, loss_sensitivity,
+                        confirmation_bias=0.3, social_proof_weight=0.4,
+                        neighbors: Optional[List[List[int]]] = None,
+                        rng: Optional[np.random.Generator] = None,
+                        history_length: int = 32) -> 'PsychologicalPopulation':
+        """Build a population from scalar or per-agent parameter values
+        
+        `neighbors[i]` lists the population indices agent i is connected to; those
+        connections are allocated up front at the agent's default trust. Each agent
+        remembers its last `history_length` messages; 0 turns history off, which keeps
+        recording (the largest per-wave cost after the belief kernel) out of big runs.
+        """
+
+        size = len(agent_ids)
+        trust = _per_agent(trust_level, size)
+        urgency_table = np.stack([np.ones(size, dtype=np.float32), _per_agent(loss_sensitivity, size)])
+
+        population = cls(
+            agent_ids=list(agent_ids),
+            base_trust_level=trust,
+            loss_sensitivity=urgency_table[1],
+            confirmation_bias=_per_agent(confirmation_bias, size),
+            social_proof_weight=_per_agent(social_proof_weight, size),
+            emotional_state=np.zeros(size, dtype=np.float32),
+            # Initialize trust levels for new connections
+            default_trust=trust.copy(),
+            urgency_table=urgency_table,
+            beliefs=np.zeros((size, 0), dtype=np.int8),
+            trust_indptr=np.zeros(size + 1, dtype=np.int64),
+            trust_indices=np.zeros(0, dtype=np.int32),
+            trust_data=np.zeros(0, dtype=np.uint8),
+            pending_trust={},
+            trust_sum=np.zeros(size, dtype=np.int64),
+            belief_abs_sum=np.zeros(size, dtype=np.int64),
+            belief_count=np.zeros(size, dtype=np.int64),
+            node_ids=list(agent_ids),
+            node_to_idx={agent_id: i for i, agent_id in enumerate(agent_ids)},
+            history=np.zeros((size, history_length), dtype=info_dtype),
+            history_count=np.zeros(size, dtype=np.int64),
+            rng=rng if rng is not None else np.random.default_rng()
+        )
+        if neighbors is not None:
+            population.connect(neighbors)
+
+        return population
+
+    def connect(self, neighbors: List[List[int]]):
+        """Replace the trust matrix with a fixed topology, every connection at default trust"""
+
+        if len(neighbors) != len(self):
+            raise ValueError(f"expected neighbor lists for {len(self)} agents, got {len(neighbors)}")
+
+        # Rows must be sorted and duplicate-free for edge_index's binary search
+        rows = [np.unique(np.asarray(row, dtype=np.int32)) for row in neighbors]
+        for i, row in enumerate(rows):
+            if len(row) and (row[0] < 0 or row[-1] >= len(self)):
+                raise ValueError(f"neighbors of agent {i} must be population indices in [0, {len(self)})")
+
+        self.trust_indptr = np.zeros(len(self) + 1, dtype=np.int64)
+        self.trust_indptr[1:] = np.cumsum([len(row) for row in rows])
+        self.trust_indices = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int32)
+        default_trust = encode_trust(self.default_trust)
+        self.trust_data = np.repeat(default_trust, np.diff(self.trust_indptr))
+        self.trust_sum = np.diff(self.trust_indptr) * default_trust.astype(np.int64)
+        self.pending_trust = {}
+
+    def flush_trust(self):
+        """Merge the connections buffered by set_trust into the CSR arrays in one O(nnz) pass"""
+
+        if not self.pending_trust:
+            return
+
+        count = len(self.pending_trust)
+        pending = np.fromiter((k for key in self.pending_trust for k in key), dtype=np.int64, count=2 * count).reshape(count, 2)
+        rows = np.concatenate([np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.trust_indptr)), pending[:, 0]])
+        nodes = np.concatenate([self.trust_indices, pending[:, 1].astype(np.int32)])
+        data = np.concatenate([self.trust_data, np.fromiter(self.pending_trust.values(), dtype=np.uint8, count=count)])
+
+        # Re-sort by (row, node) so rows stay sorted for edge_index's binary search
+        order = np.lexsort((nodes, rows))
+        self.trust_indices = nodes[order]
+        self.trust_data = data[order]
+        self.trust_indptr = np.zeros(len(self) + 1, dtype=np.int64)
+        self.trust_indptr[1:] = np.cumsum(np.bincount(rows, minlength=len(self)))
+        self.pending_trust = {}
+
+    def to_device(self) -> 'PsychologicalPopulation':
+        """Move the numeric arrays into GPU memory with CuPy
+        
+        The batched functions below then run as GPU kernels. History, the ID maps
+        and the random generator stay on the host; per-agent views and topology
+        edits (connect, set_trust) expect host arrays, so call to_host() before
+        using them.
+        """
+        if not CUPY_AVAILABLE:
+            raise ImportError("CuPy is required to move a population to the GPU")
+
+        self.flush_trust()
+        for name in _DEVICE_FIELDS:
+            setattr(self, name, cupy.asarray(getattr(self, name)))
+        self.loss_sensitivity = self.urgency_table[1]
+        return self
+
+    def to_host(self) -> 'PsychologicalPopulation':
+        """Bring the numeric arrays back into host memory"""
+        for name in _DEVICE_FIELDS:
+            setattr(self, name, asnumpy(getattr(self, name)))
+        self.loss_sensitivity = self.urgency_table[1]
+        return self
+
+    def __len__(self) -> int:
+        return len(self.agent_ids)
+
+    def __getitem__(self, index: int) -> 'PsychologicalAgent':
+        """Agent view onto row `index`"""
+        from .psychological_agent import PsychologicalAgent
+
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"agent index {index} out of range")
+        return PsychologicalAgent.view(self, index % len(self))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def ensure_topic(self, topic_id: int):
+        """Make sure the belief matrix has a column for `topic_id`"""
+
+        # Grow the matrix geometrically so new topics are amortized O(1)
+        capacity = self.beliefs.shape[1]
+        if topic_id >= capacity:
+            xp = get_array_module(self.beliefs)
+            grown = xp.zeros((len(self), max(4, 2 * capacity, topic_id + 1)), dtype=self.beliefs.dtype)
+            grown[:, :capacity] = self.beliefs
+            self.beliefs = grown
+
+    def node_index(self, agent_id: str) -> int:
+        """Column of `agent_id` in the trust matrix, registering it if unseen"""
+
+        idx = self.node_to_idx.get(agent_id)
+        if idx is None:
+            idx = len(self.node_ids)
+            self.node_ids.append(agent_id)
+            self.node_to_idx[agent_id] = idx
+
+        return idx
+
+    def edge_index(self, index: int, agent_id: str) -> int:
+        """Position of agent `index`'s connection to `agent_id` in trust_data, or -1
+        
+        Connections still buffered in pending_trust are not in trust_data yet, so
+        they report -1 until flush_trust merges them.
+        """
+
+        node = self.node_to_idx.get(agent_id)
+        if node is None:
+            return -1
+
+        # Rows are kept sorted by node, so the lookup is a binary search over one slice
+        start, end = self.trust_indptr[index], self.trust_indptr[index + 1]
+        pos = start + int(np.searchsorted(self.trust_indices[start:end], node))
+        if pos < end and self.trust_indices[pos] == node:
+            return pos
+        return -1
+
+    def edge_indices(self, rows: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        """Vectorized edge_index for (agent row, node column) pairs, -1 where unconnected"""
+
+        self.flush_trust()
+        xp = get_array_module(self.trust_indices)
+        rows = xp.asarray(rows, dtype=xp.int64)
+        nodes = xp.asarray(nodes, dtype=xp.int64)
+
+        # Row of every edge; CuPy's repeat takes no per-element counts, so the device maps edges back by search
+        if xp is np:
+            edge_rows = np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.trust_indptr))
+        else:
+            edge_rows = xp.searchsorted(self.trust_indptr, xp.arange(len(self.trust_indices)), side='right') - 1
+
+        # Sorted rows make (row, node) keys globally sorted, so one searchsorted resolves every pair
+        width = len(self.node_ids)
+        keys = edge_rows * width + self.trust_indices
+        wanted = rows * width + nodes
+        pos = xp.searchsorted(keys, wanted)
+        found = (nodes >= 0) & (nodes < width) & (pos < len(keys))
+        found[found] = keys[pos[found]] == wanted[found]
+        return xp.where(found, pos, -1)
+
+    def trust_in(self, index: int, agent_id: str) -> float:
+        """Trust agent `index` places in `agent_id`, or its default trust if unconnected"""
+
+        edge = self.edge_index(index, agent_id)
+        if edge >= 0:
+            return float(decode_trust(self.trust_data[edge]))
+
+        quantized = self.pending_trust.get((index, self.node_to_idx.get(agent_id)))
+        if quantized is not None:
+            return float(decode_trust(quantized))
+        return float(self.default_trust[index])
+
+    def set_trust(self, index: int, agent_id: str, trust: float):
+        """Set the trust agent `index` places in `agent_id`, adding the connection if needed"""
+
+        edge = self.edge_index(index, agent_id)
+        if edge >= 0:
+            self.store_trust(index, edge, trust)
+            return
+
+        # New (or still buffered) connection: keep it in pending_trust until the next bulk merge
+        key = (index, self.node_index(agent_id))
+        quantized = encode_trust(trust)
+        self.trust_sum[index] += int(quantized) - int(self.pending_trust.get(key, 0))
+        self.pending_trust[key] = quantized
+
+    def store_trust(self, index: int, edge: int, trust: float):
+        """Overwrite agent `index`'s existing connection `edge`, keeping trust_sum in step"""
+
+        quantized = encode_trust(trust)
+        self.trust_sum[index] += int(quantized) - int(self.trust_data[edge])
+        self.trust_data[edge] = quantized
+
+    def track_beliefs(self, receivers, old: np.ndarray, new: np.ndarray, distinct: bool = True):
+        """Keep the running belief totals in step after receivers' beliefs went from `old` to `new` (quantized)
+        
+        Pass distinct=False when a receiver can appear more than once.
+        """
+
+        xp = get_array_module(old)
+        # |belief| is at most 127, so both differences fit in int8 without widening the whole wave
+        abs_change = xp.abs(new) - xp.abs(old)
+        count_change = (new != 0).view(xp.int8) - (old != 0).view(xp.int8)
+        if distinct:
+            self.belief_abs_sum[receivers] += abs_change
+            self.belief_count[receivers] += count_change
+        else:
+            scatter_add(self.belief_abs_sum, receivers, abs_change.astype(xp.int64))
+            scatter_add(self.belief_count, receivers, count_change.astype(xp.int64))
+
+    def neighbors(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Node indices and quantized trust levels of agent `index`'s connections, as views into the CSR arrays"""
+
+        self.flush_trust()
+        start, end = self.trust_indptr[index], self.trust_indptr[index + 1]
+        return self.trust_indices[start:end], self.trust_data[start:end]
+
+    def encode_messages(self, infos: List[Information]) -> np.ndarray:
+        """Pack `infos` into an info_dtype array, resolving sources to this population's node indices"""
+
+        return np.array([
+            (info.topic_id, info.value, info.confidence, self.node_index(info.source_id), info.timestamp)
+            for info in infos
+        ], dtype=info_dtype)
+
+    def record_history(self, receivers: np.ndarray, info, distinct: bool = True):
+        """Append to each receiver's history, overwriting its oldest entry once full
+        
+        `info` is an Information for every receiver, or an info_dtype array holding
+        one message per receiver. Pass distinct=False when a receiver can appear more
+        than once; its messages are then appended in the order given.
+        """
+
+        length = self.history.shape[1]
+        if length == 0:
+            return
+
+        receivers = asnumpy(receivers)
+        if isinstance(info, Information):
+            info = info.to_array(self.node_index(info.source_id))
+
+        if distinct:
+            slots = self.history_count[receivers] % length
+            self.history[receivers, slots] = info
+            self.history_count[receivers] += 1
+            return
+
+        # A receiver's repeats fill consecutive slots; past the ring length the latest write wins
+        slots = (self.history_count[receivers] + _repeat_rank(receivers)) % length
+        self.history[receivers, slots] = info
+        np.add.at(self.history_count, receivers, 1)
+
+    def history_of(self, index: int) -> List[Information]:
+        """Agent `index`'s remembered messages, oldest first
+        
+        value and confidence are stored as float32; they come back as the shortest decimal
+        with the same float32, so inputs with up to 7 significant digits compare equal.
+        """
+
+        length = self.history.shape[1]
+        if length == 0:
+            return []
+
+        count = int(self.history_count[index])
+        slots = np.arange(max(0, count - length), count) % length
+
+        topics = list(TOPIC_REGISTRY)
+        return [
+            Information(topics[entry['topic_id']], _from_float32(entry['value']), _from_float32(entry['confidence']),
+                        self.node_ids[entry['source_id']], int(entry['timestamp']))
+            for entry in self.history[index, slots]
+        ]
+
+    def connection_trust_to(self, agent_id: str) -> np.ndarray:
+        """Every agent's trust in `agent_id`, falling back to default trust where unconnected"""
+
+        self.flush_trust()
+        xp = get_array_module(self.trust_data)
+        trust = self.default_trust.copy()
+        node = self.node_to_idx.get(agent_id)
+        if node is not None:
+            # Gather the column in one pass over the CSR arrays, mapping each edge back to its row
+            edges = xp.flatnonzero(self.trust_indices == node)
+            rows = xp.searchsorted(self.trust_indptr, edges, side='right') - 1
+            trust[rows] = decode_trust(self.trust_data[edges])
+
+        return trust
+
+    def connection_trust(self, index: int) -> Dict[str, float]:
+        """Agent `index`'s connections as an agent_id -> trust dict"""
+
+        nodes, trust = self.neighbors(index)
+        return {self.node_ids[node]: float(t) for node, t in zip(nodes, decode_trust(trust))}
+
+    def belief_dict(self, index: int) -> Dict[str, float]:
+        """Agent `index`'s non-zero beliefs as a topic -> belief dict
+        
+        A belief that returns to (or quantizes to) 0 is indistinguishable from a topic
+        never heard, so it is left out, as it is from belief_count.
+        """
+
+        row = decode_beliefs(self.beliefs[index])
+        return {
+            topic: float(row[topic_id]) for topic, topic_id in TOPIC_REGISTRY.items()
+            if topic_id < len(row) and row[topic_id] != 0.0
+        }
+
+def process_information_batch(pop: PsychologicalPopulation, info: Information, source_trust_vec,
+                              receivers: Optional[np.ndarray] = None) -> np.ndarray:
+    """Process information through psychological filters for many agents at once
+    
+    Vectorized equivalent of PsychologicalAgent.process_information.
+    
+    Args:
+        pop (PsychologicalPopulation): Population whose beliefs are updated in place.
+        info (Information): The information being processed.
+        source_trust_vec: Each receiver's trust in the source (0.0 to 1.0), or a scalar.
+        receivers (np.ndarray, optional): Indices of the receiving agents; defaults to every agent. A repeated
+            receiver hears the information once per occurrence, in order.
+    Returns:
+        np.ndarray: Magnitude of each receiver's belief change (for measuring cascade effects).
+    """
+    
+    xp = get_array_module(pop.beliefs)
+    topic = info.topic_id
+    pop.ensure_topic(topic)
+    explicit_receivers = receivers is not None
+    if receivers is None:
+        receivers = xp.arange(len(pop))
+    receivers = xp.ascontiguousarray(xp.asarray(receivers, dtype=xp.int64))
+    source_trust = xp.ascontiguousarray(xp.broadcast_to(xp.asarray(source_trust_vec, dtype=xp.float32), receivers.shape))
+    
+    # A repeated receiver would race in the parallel kernel and double-count the running totals, so
+    # repeats run in later rounds; the bincount check keeps the usual distinct case to a single pass
+    rounds = [slice(None)]
+    if explicit_receivers and len(receivers) and int(xp.bincount(receivers, minlength=len(pop)).max()) > 1:
+        rounds = _rounds(_repeat_rank(asnumpy(receivers)), xp)
+    
+    delta = xp.empty(receivers.shape, dtype=xp.float32)
+    for batch in rounds:
+        batch_receivers = xp.ascontiguousarray(receivers[batch])
+        batch_delta = delta if len(rounds) == 1 else xp.empty(batch_receivers.shape, dtype=xp.float32)
+        old_beliefs = pop.beliefs[batch_receivers, topic]
+        update_beliefs(pop.beliefs, topic, batch_receivers, pop.loss_sensitivity, pop.confirmation_bias,
+                       float(info.value), xp.ascontiguousarray(source_trust[batch]), batch_delta)
+        if batch_delta is not delta:
+            delta[batch] = batch_delta
+        pop.track_beliefs(batch_receivers, old_beliefs, pop.beliefs[batch_receivers, topic])
+    
+    pop.record_history(receivers, info, distinct=len(rounds) == 1)
+    
+    return delta
+
+def process_messages_batch(pop: PsychologicalPopulation, msgs: np.ndarray, receivers: np.ndarray) -> np.ndarray:
+    """Process a whole cascade wave in which receivers[k] hears message msgs[k]
+    
+    Like process_information_batch, but every receiver can get a different topic,
+    value and source, e.g. when many sharers flood their neighbors in one step.
+    Each source's trust is looked up in the receiver's own trust row.
+    
+    Args:
+        pop (PsychologicalPopulation): Population whose beliefs are updated in place.
+        msgs (np.ndarray): info_dtype messages (see encode_messages), one per receiver.
+        receivers (np.ndarray): Receiving agent of each message; a receiver may hear several
+            messages in one wave, and repeats of a topic are applied in message order.
+    Returns:
+        np.ndarray: Magnitude of each receiver's belief change (for measuring cascade effects).
+    """
+    
+    xp = get_array_module(pop.beliefs)
+    receivers = xp.asarray(receivers, dtype=xp.int64)
+    if len(msgs):
+        pop.ensure_topic(int(msgs['topic_id'].max()))
+    
+    # Structured records stay on the host; only their numeric fields move to the population's device
+    topics = xp.asarray(msgs['topic_id'])
+    values = xp.asarray(msgs['value'])
+    
+    # Trust in each message's source, or the receiver's default trust where unconnected
+    edges = pop.edge_indices(receivers, xp.asarray(msgs['source_id']))
+    found = edges >= 0
+    source_trust = pop.default_trust[receivers]
+    source_trust[found] = decode_trust(pop.trust_data[edges[found]])
+    
+    # Two sharers can push the same topic to a shared neighbor; such repeats run in later rounds,
+    # so every kernel call updates distinct (receiver, topic) pairs and sees the previous result
+    keys = asnumpy(receivers) * pop.beliefs.shape[1] + msgs['topic_id']
+    delta = xp.empty(receivers.shape, dtype=xp.float32)
+    for batch in _rounds(_repeat_rank(keys), xp):
+        batch_receivers, batch_topics = receivers[batch], topics[batch]
+        old_beliefs = pop.beliefs[batch_receivers, batch_topics]
+        batch_delta = xp.empty(batch_receivers.shape, dtype=xp.float32)
+        update_beliefs_per_message(pop.beliefs, batch_topics, batch_receivers, pop.loss_sensitivity,
+                                   pop.confirmation_bias, values[batch], source_trust[batch], batch_delta)
+        delta[batch] = batch_delta
+        pop.track_beliefs(batch_receivers, old_beliefs, pop.beliefs[batch_receivers, batch_topics], distinct=False)
+    
+    pop.record_history(receivers, msgs, distinct=False)
+    
+    return delta
+
+def decide_to_share_batch(pop: PsychologicalPopulation, info: Information,
+                          receivers: Optional[np.ndarray] = None, source_trust_vec=None) -> np.ndarray:
+    """Decide for many agents at once whether to share information with neighbors
+    
+    Vectorized equivalent of PsychologicalAgent.decide_to_share: all share
+    probabilities are computed as array ops and drawn in a single call.
+    
+    Args:
+        pop (PsychologicalPopulation): Population making the decision.
+        info (Information): The information being considered for sharing.
+        receivers (np.ndarray, optional): Indices of the deciding agents; defaults to every agent.
+        source_trust_vec (optional): Each decider's trust in the source, or a scalar; gathered from
+            the trust matrix (an O(N + nnz) pass) when omitted.
+    Returns:
+        np.ndarray: Boolean mask over the deciding agents, True where they share.
+    """
+    
+    xp = get_array_module(pop.beliefs)
+    if receivers is None:
+        receivers = xp.arange(len(pop))
+    
+    if info.topic_id >= pop.beliefs.shape[1]:
+        belief_strength = xp.zeros(len(receivers), dtype=xp.float32)
+    else:
+        belief_strength = xp.abs(decode_beliefs(pop.beliefs[receivers, info.topic_id]))
+    if source_trust_vec is None:
+        source_trust = pop.connection_trust_to(info.source_id)[receivers]
+    else:
+        source_trust = xp.asarray(source_trust_vec, dtype=xp.float32)
+    
+    # Loss aversion: negative information is more "shareable"; the urgency row is picked once per wave
+    urgency_factor = pop.urgency_table[int(info.value < 0)][receivers]
+    
+    share_probability = (belief_strength * source_trust * urgency_factor) / 3.0
+    
+    # Drawn on the host so results match whether or not the population is on the GPU
+    return xp.asarray(pop.rng.random(len(receivers))) < share_probability
+
+def trust_change(interaction_outcomes, loss_sensitivity):
+    """Trust adjustment for each interaction outcome, given the truster's loss sensitivity"""
+    
+    xp = get_array_module(interaction_outcomes)
+    
+    # Positive outcome: modest trust increase; negative outcome: loss aversion amplifies trust damage
+    return xp.where(interaction_outcomes > 0, 0.1 * interaction_outcomes,
+                    loss_sensitivity * interaction_outcomes * 0.2)
+
+def update_trust_batch(pop: PsychologicalPopulation, edges: np.ndarray, interaction_outcomes: np.ndarray):
+    """Update trust on many existing connections at once
+    
+    Vectorized equivalent of PsychologicalAgent.update_trust for connections that
+    are already in the trust matrix (see edge_indices). A repeated edge is updated
+    once per occurrence, in order.
+    
+    Args:
+        pop (PsychologicalPopulation): Population whose trust matrix is updated in place.
+        edges (np.ndarray): Positions of the connections in pop.trust_data.
+        interaction_outcomes (np.ndarray): Outcome of each interaction.
+    """
+    
+    xp = get_array_module(pop.trust_data)
+    edges = xp.asarray(edges, dtype=xp.int64)
+    interaction_outcomes = xp.asarray(interaction_outcomes, dtype=xp.float32)
+    rows = xp.searchsorted(pop.trust_indptr, edges, side='right') - 1
+    
+    # An agent can hit the same peer twice in one step; repeated edges run in later rounds, so each
+    # update starts from the previous one and trust_sum gains every change exactly once
+    for batch in _rounds(_repeat_rank(asnumpy(edges)), xp):
+        batch_edges, batch_rows = edges[batch], rows[batch]
+        old_trust = pop.trust_data[batch_edges]
+        change = trust_change(interaction_outcomes[batch], pop.loss_sensitivity[batch_rows])
+        new_trust = encode_trust(decode_trust(old_trust) + change)
+        pop.trust_data[batch_edges] = new_trust
+        scatter_add(pop.trust_sum, batch_rows, new_trust.astype(xp.int64) - old_trust)
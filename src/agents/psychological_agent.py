@@ -1,112 +1,124 @@
-import random
-from dataclasses import dataclass, field
-from typing import Any, Dict
+import numpy as np
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 from .base_agent import BaseAgent, Information
+from .kernels import BELIEF_SCALE, TRUST_SCALE
+from .population import (PsychologicalPopulation, decide_to_share_batch, process_information_batch,
+                         trust_change, update_trust_batch)
+
+def _population_field(name: str) -> property:
+    """Property reading and writing this agent's entry in a population array"""
+    
+    def fget(self) -> float:
+        return float(getattr(self.population, name)[self.index])
+    
+    def fset(self, value: float):
+        getattr(self.population, name)[self.index] = value
+    
+    return property(fget, fset)
 
-@dataclass
 class PsychologicalAgent(BaseAgent):
-    """Agent with psychological biases from your prisoner's dilemma research"""
+    """Agent with psychological biases from your prisoner's dilemma research
+    
+    The agent is a thin view onto one row of a PsychologicalPopulation; all of its
+    state lives in the population's arrays. Its methods wrap the module-level batch
+    functions in population for single-agent use; simulation loops should call
+    those functions directly.
+    """
+    
+    __slots__ = ('population', 'index')
+    
+    # Core psychological parameters (from your research)
+    base_trust_level = _population_field('base_trust_level')  # 0.0 to 1.0
+    loss_sensitivity = _population_field('loss_sensitivity')  # 1.0 to 3.0
+    
+    # Psychological state that evolves
+    confirmation_bias = _population_field('confirmation_bias')  # Tendency to accept confirming information
+    social_proof_weight = _population_field('social_proof_weight')  # How much others' beliefs matter
+    emotional_state = _population_field('emotional_state')  # -1.0 (stressed) to 1.0 (confident)
+    
+    # Initial trust level for new connections
+    default_trust = _population_field('default_trust')
     
     def __init__(self, agent_id: str, trust_level: float = 0.6, loss_sensitivity: float = 1.5):
-        super().__init__(agent_id)
-        
-        # Core psychological parameters (from your research)
-        self.base_trust_level = trust_level  # 0.0 to 1.0
-        self.loss_sensitivity = loss_sensitivity  # 1.0 to 3.0
-        
-        # Psychological state that evolves
-        self.confirmation_bias = 0.3  # Tendency to accept confirming information
-        self.social_proof_weight = 0.4  # How much others' beliefs matter
-        self.emotional_state = 0.0  # -1.0 (stressed) to 1.0 (confident)
-        
-        # Initialize trust levels for new connections
-        self.default_trust = trust_level
+        # A standalone agent is backed by a population of one
+        population = PsychologicalPopulation.from_parameters([agent_id], trust_level, loss_sensitivity)
+        self._bind(population, 0)
+    
+    @classmethod
+    def view(cls, population: PsychologicalPopulation, index: int) -> 'PsychologicalAgent':
+        """Agent view onto row `index` of an existing population"""
+        agent = cls.__new__(cls)
+        agent._bind(population, index)
+        return agent
+    
+    def _bind(self, population: PsychologicalPopulation, index: int):
+        super().__init__(population.agent_ids[index])
+        self.population = population
+        self.index = index
+    
+    @property
+    def beliefs(self) -> Mapping[str, float]:
+        """Read-only snapshot of topic -> belief for the topics with a non-zero belief"""
+        return MappingProxyType(self.population.belief_dict(self.index))
+    
+    @property
+    def connections(self) -> Mapping[str, float]:
+        """Read-only snapshot of agent_id -> trust level; change trust through update_trust"""
+        return MappingProxyType(self.population.connection_trust(self.index))
+    
+    @property
+    def information_history(self) -> Tuple[Information, ...]:
+        """Snapshot of the most recent messages received, oldest first (see history_of for precision)"""
+        return tuple(self.population.history_of(self.index))
     
     def process_information(self, info: Information, source_trust: float) -> float:
-        """Process information through psychological filters"""
-        
-        # Step 1: Apply loss aversion - negative information feels worse
-        if info.value < 0:
-            psychological_impact = info.value * self.loss_sensitivity
-        else:
-            psychological_impact = info.value
-        
-        # Step 2: Weight by source trust
-        trusted_impact = psychological_impact * source_trust
-        
-        # Step 3: Apply confirmation bias
-        current_belief = self.beliefs.get(info.topic, 0.0)
+        """Process information through psychological filters
         
-        # If information confirms existing belief, accept more readily
-        if (current_belief > 0 and info.value > 0) or (current_belief < 0 and info.value < 0):
-            confirmation_bonus = self.confirmation_bias
-        else:
-            confirmation_bonus = -self.confirmation_bias
-        
-        final_impact = trusted_impact + confirmation_bonus
-        
-        # Step 4: Update belief
-        old_belief = self.beliefs.get(info.topic, 0.0)
-        # Simple learning rate
-        learning_rate = 0.3
-        new_belief = old_belief + (learning_rate * final_impact)
-        new_belief = max(-1.0, min(1.0, new_belief))  # Clamp to [-1, 1]
-        
-        self.beliefs[info.topic] = new_belief
-        self.information_history.append(info)
+        Single-agent wrapper around process_information_batch.
+        """
+        delta = process_information_batch(self.population, info, source_trust, np.array([self.index]))
         
         # Return the magnitude of belief change (for measuring cascade effects)
-        return abs(new_belief - old_belief)
+        return float(delta[0])
     
     def decide_to_share(self, info: Information) -> bool:
-        """Decide whether to share information with neighbors"""
-        
-        # More likely to share if:
-        # 1. We have strong belief about the topic
-        # 2. Information is negative (loss aversion makes bad news "sticky")
-        # 3. We trust the source
+        """Decide whether to share information with neighbors
         
-        belief_strength = abs(self.beliefs.get(info.topic, 0.0))
-        source_trust = self.connections.get(info.source_id, self.default_trust)
-        
-        # Loss aversion: negative information is more "shareable"
-        if info.value < 0:
-            urgency_factor = self.loss_sensitivity
-        else:
-            urgency_factor = 1.0
-        
-        share_probability = (belief_strength * source_trust * urgency_factor) / 3.0
-        
-        return random.random() < share_probability
+        Single-agent wrapper around decide_to_share_batch.
+        """
+        # One O(log degree) lookup instead of gathering every agent's trust in the source
+        source_trust = self.population.trust_in(self.index, info.source_id)
+        return bool(decide_to_share_batch(self.population, info, np.array([self.index]), source_trust)[0])
     
     def update_trust(self, other_agent_id: str, interaction_outcome: float):
-        """Update trust based on interaction outcome (reuse your prisoner's dilemma logic)"""
-        
-        if other_agent_id not in self.connections:
-            self.connections[other_agent_id] = self.default_trust
-        
-        current_trust = self.connections[other_agent_id]
-        
-        if interaction_outcome > 0:
-            # Positive outcome: modest trust increase
-            trust_change = 0.1 * interaction_outcome
-        else:
-            # Negative outcome: loss aversion amplifies trust damage
-            trust_change = self.loss_sensitivity * interaction_outcome * 0.2
-        
-        new_trust = current_trust + trust_change
-        new_trust = max(0.0, min(1.0, new_trust))  # Clamp to [0, 1]
-        
-        self.connections[other_agent_id] = new_trust
+        """Update trust based on interaction outcome (reuse your prisoner's dilemma logic)
+        
+        Single-agent wrapper around update_trust_batch.
+        """
+        edge = self.population.edge_index(self.index, other_agent_id)
+        if edge >= 0:
+            update_trust_batch(self.population, np.array([edge]), np.array([interaction_outcome]))
+            return
+        
+        # New (or still buffered) connection: set_trust records it without rebuilding the trust matrix
+        current_trust = self.population.trust_in(self.index, other_agent_id)
+        change = trust_change(np.float32(interaction_outcome), np.float32(self.loss_sensitivity))
+        self.population.set_trust(self.index, other_agent_id, current_trust + float(change))
     
     def get_psychological_summary(self) -> Dict[str, Any]:
         """Get agent's psychological state for analysis"""
+        # O(1) from the population's running totals rather than rescanning trust and beliefs
+        pop = self.population
+        pop.flush_trust()
+        num_connections = int(pop.trust_indptr[self.index + 1] - pop.trust_indptr[self.index])
+        num_beliefs = int(pop.belief_count[self.index])
         return {
             'agent_id': self.agent_id,
             'base_trust': self.base_trust_level,
             'loss_sensitivity': self.loss_sensitivity,
-            'avg_trust': sum(self.connections.values()) / len(self.connections) if self.connections else self.default_trust,
-            'num_beliefs': len(self.beliefs),
-            'belief_strength': sum(abs(b) for b in self.beliefs.values()) / len(self.beliefs) if self.beliefs else 0.0,
+            'avg_trust': int(pop.trust_sum[self.index]) / TRUST_SCALE / num_connections if num_connections else self.default_trust,
+            'num_beliefs': num_beliefs,
+            'belief_strength': int(pop.belief_abs_sum[self.index]) / BELIEF_SCALE / num_beliefs if num_beliefs else 0.0,
             'emotional_state': self.emotional_state
-        }
\ No newline at end of file
+        }
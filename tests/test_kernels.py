@@ -0,0 +1,78 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.agents import kernels, population
+from src.agents.base_agent import Information
+from src.agents.population import PsychologicalPopulation, process_information_batch, process_messages_batch
+
+def _random_wave(seed: int, size: int = 100_000):
+    rng = np.random.default_rng(seed)
+    beliefs = rng.integers(-127, 128, size=(size, 3)).astype(np.int8)
+    receivers = np.sort(rng.choice(size, size // 2, replace=False)).astype(np.int64)
+    loss_sensitivity = rng.uniform(1.0, 3.0, size).astype(np.float32)
+    confirmation_bias = rng.uniform(0.0, 0.6, size).astype(np.float32)
+    source_trust = rng.uniform(0.0, 1.0, len(receivers)).astype(np.float32)
+    return beliefs, receivers, loss_sensitivity, confirmation_bias, source_trust
+
+class KernelParityTest(unittest.TestCase):
+    """Every host backend must store the same int8 beliefs as the NumPy kernel"""
+
+    def assert_matches_numpy(self, kernel):
+        for seed, info_value in enumerate([-0.83, -0.5, 0.0, 0.37, 1.0]):
+            beliefs, receivers, loss_sensitivity, confirmation_bias, source_trust = _random_wave(seed)
+            expected, actual = beliefs.copy(), beliefs.copy()
+            expected_delta = np.empty(len(receivers), dtype=np.float32)
+            actual_delta = np.empty(len(receivers), dtype=np.float32)
+
+            kernels._update_beliefs_numpy(expected, 1, receivers, loss_sensitivity, confirmation_bias,
+                                          info_value, source_trust, expected_delta)
+            kernel(actual, 1, receivers, loss_sensitivity, confirmation_bias,
+                   info_value, source_trust, actual_delta)
+
+            np.testing.assert_array_equal(actual, expected)
+            np.testing.assert_array_equal(actual_delta, expected_delta)
+
+    @unittest.skipUnless(kernels.NUMBA_AVAILABLE, "Numba is not installed")
+    def test_numba_kernel_matches_numpy(self):
+        self.assert_matches_numpy(kernels._kernel_update_beliefs)
+
+    @unittest.skipUnless(kernels.CYTHON_AVAILABLE, "_kernels.pyx is not built")
+    def test_cython_kernel_matches_numpy(self):
+        self.assert_matches_numpy(kernels._cython_update_beliefs)
+
+class _DeviceLikeModule:
+    """Stand-in for CuPy: NumPy underneath, but where() only takes an array condition"""
+
+    def __getattr__(self, name):
+        return getattr(np, name)
+
+    @staticmethod
+    def where(condition, x, y):
+        return np.where(condition.astype('?'), x, y)
+
+class ArrayModuleDispatchTest(unittest.TestCase):
+    """Drive the device (non-NumPy) code paths on the CPU through get_array_module"""
+
+    def run_wave(self, on_device: bool) -> PsychologicalPopulation:
+        pop = PsychologicalPopulation.from_parameters(['x', 'y', 'z'], [0.4, 0.6, 0.8], [1.2, 1.5, 2.5],
+                                                      neighbors=[[1], [0, 2], []])
+        bad_news, good_news = Information('d1', -0.7, 1.0, 'y'), Information('d2', 0.5, 1.0, 'x')
+        array_module = _DeviceLikeModule() if on_device else np
+        with mock.patch.object(kernels, 'get_array_module', lambda array: array_module), \
+                mock.patch.object(population, 'get_array_module', lambda array: array_module):
+            process_information_batch(pop, bad_news, 0.7)
+            process_information_batch(pop, good_news, np.array([0.2, 0.9]), np.array([2, 1]))
+            process_messages_batch(pop, pop.encode_messages([bad_news, good_news, bad_news]), np.array([0, 1, 2]))
+        return pop
+
+    def test_device_path_matches_host_path(self):
+        host, device = self.run_wave(on_device=False), self.run_wave(on_device=True)
+
+        np.testing.assert_array_equal(device.beliefs, host.beliefs)
+        np.testing.assert_array_equal(device.belief_count, host.belief_count)
+        np.testing.assert_array_equal(device.belief_abs_sum, host.belief_abs_sum)
+
+if __name__ == '__main__':
+    unittest.main()
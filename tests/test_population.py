@@ -0,0 +1,84 @@
+import unittest
+
+import numpy as np
+
+from src.agents.base_agent import Information
+from src.agents.population import (PsychologicalPopulation, process_information_batch, process_messages_batch,
+                                   update_trust_batch)
+
+class ProcessMessagesBatchTest(unittest.TestCase):
+    def test_population_without_trust_edges_uses_default_trust(self):
+        pop = PsychologicalPopulation.from_parameters(['x', 'y'], 0.5, 1.5)
+        info = Information('t1', -0.6, 1.0, 'y')
+        msgs = pop.encode_messages([info, info])
+
+        delta = process_messages_batch(pop, msgs, np.array([0, 1]))
+
+        # Unconnected sources fall back to the receiver's default trust
+        expected = PsychologicalPopulation.from_parameters(['x', 'y'], 0.5, 1.5)
+        np.testing.assert_array_equal(delta, process_information_batch(expected, info, 0.5))
+        np.testing.assert_array_equal(pop.beliefs, expected.beliefs)
+
+    def test_repeated_receiver_keeps_every_message_in_history(self):
+        pop = PsychologicalPopulation.from_parameters(['x', 'y'], 0.5, 1.5, history_length=4)
+        msgs = pop.encode_messages([Information('t1', 0.4, 1.0, 'y'), Information('t2', -0.4, 1.0, 'y'),
+                                    Information('t1', 0.4, 1.0, 'x')])
+
+        process_messages_batch(pop, msgs, np.array([0, 0, 1]))
+
+        np.testing.assert_array_equal(pop.history_count, [2, 1])
+        self.assertEqual([info.topic for info in pop.history_of(0)], ['t1', 't2'])
+
+    def test_repeated_topic_for_a_receiver_is_applied_in_order(self):
+        pop = PsychologicalPopulation.from_parameters(['x', 'y'], 0.5, 1.5)
+        first, second = Information('rumor', -0.6, 1.0, 'y'), Information('rumor', -0.4, 1.0, 'x')
+
+        delta = process_messages_batch(pop, pop.encode_messages([first, second]), np.array([0, 0]))
+
+        # Same result as hearing the two messages one after the other
+        expected = PsychologicalPopulation.from_parameters(['x', 'y'], 0.5, 1.5)
+        expected_delta = [process_information_batch(expected, info, 0.5, np.array([0]))[0] for info in (first, second)]
+        np.testing.assert_array_equal(delta, expected_delta)
+        np.testing.assert_array_equal(pop.beliefs, expected.beliefs)
+        self.assertEqual(pop.belief_count[0], 1)
+
+        process_messages_batch(pop, pop.encode_messages([Information('econ', 0.9, 1.0, 'y')]), np.array([0]))
+        self.assertEqual(pop[0].get_psychological_summary()['num_beliefs'], len(pop[0].beliefs))
+
+class RunningTotalsTest(unittest.TestCase):
+    def test_repeated_receiver_hears_the_information_once_per_occurrence(self):
+        pop = PsychologicalPopulation.from_parameters(['x', 'y'], 0.5, 1.5)
+        info = Information('t1', -0.6, 1.0, 'y')
+
+        delta = process_information_batch(pop, info, np.array([0.5, 0.9, 0.5]), np.array([0, 1, 0]))
+
+        expected = PsychologicalPopulation.from_parameters(['x', 'y'], 0.5, 1.5)
+        expected_delta = [process_information_batch(expected, info, trust, np.array([receiver]))[0]
+                          for receiver, trust in [(0, 0.5), (1, 0.9), (0, 0.5)]]
+        np.testing.assert_array_equal(delta, expected_delta)
+        np.testing.assert_array_equal(pop.beliefs, expected.beliefs)
+        np.testing.assert_array_equal(pop.belief_abs_sum, np.abs(pop.beliefs.astype(np.int64)).sum(axis=1))
+        np.testing.assert_array_equal(pop.history_count, [2, 1])
+
+    def test_repeated_edge_keeps_trust_sum_exact(self):
+        pop = PsychologicalPopulation.from_parameters(['x', 'y', 'z'], 0.6, 1.5, neighbors=[[1, 2], [0], []])
+        edge = pop.edge_index(0, 'y')
+
+        update_trust_batch(pop, [edge, edge], [-0.5, -0.5])
+
+        self.assertAlmostEqual(pop.trust_in(0, 'y'), 0.6 - 2 * 0.15, delta=1 / 255)
+        np.testing.assert_array_equal(pop.trust_sum, [np.sum(pop.neighbors(i)[1], dtype=np.int64) for i in range(3)])
+
+class HistoryTest(unittest.TestCase):
+    def test_ring_buffer_keeps_the_latest_messages_after_wrapping(self):
+        pop = PsychologicalPopulation.from_parameters(['x', 'y'], 0.5, 1.5, history_length=3)
+        sent = [Information(f'h{i}', -0.5, 0.9, 'y', timestamp=i) for i in range(5)]
+        for info in sent:
+            process_information_batch(pop, info, 0.5, np.array([0]))
+
+        self.assertEqual(pop.history_count[0], 5)
+        self.assertEqual(pop.history_of(0), sent[2:])
+        self.assertEqual(pop.history_of(1), [])
+
+if __name__ == '__main__':
+    unittest.main()